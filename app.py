@@ -1,32 +1,133 @@
+import bisect
+import heapq
+import sys
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import date, timedelta
 
+# =====================================================
+# TASK STATUS
+# =====================================================
+
+STATUS_PENDING = "Pending"
+STATUS_COMPLETED = "Completed"
+
+
+# =====================================================
+# SCHEDULER WEIGHTS
+# =====================================================
+
+IMPORTANCE_WEIGHT = 2
+URGENCY_WEIGHT = 5
+NO_DUE_DATE_DAYS = 30   # days_left assumed for tasks without a due date
+
+
+# =====================================================
+# TABLE COLUMNS (field, label)
+# =====================================================
+
+SUBJECT_COLUMNS = [("name", "Subject"), ("teacher", "Teacher"), ("code", "Code")]
+TASK_COLUMNS = [
+    ("title", "Task"), ("subject", "Subject"), ("estimated_hours", "Est. Hours"),
+    ("due_date", "Due Date"), ("importance", "Importance"), ("difficulty", "Difficulty"),
+]
+UPCOMING_TASK_COLUMNS = [
+    ("title", "Task"), ("subject", "Subject"), ("due_date", "Due Date"),
+    ("estimated_hours", "Est. Hours"), ("importance", "Importance (1–5)"),
+]
+EXAM_COLUMNS = [("subject", "Subject"), ("title", "Exam"), ("date", "Date"), ("syllabus", "Syllabus / Chapters")]
+PLAN_COLUMNS = [
+    ("date_str", "Date"), ("time_block", "Session"), ("subject", "Subject"),
+    ("task_title", "Task"), ("planned_hours", "Hours"),
+]
+TODAY_PLAN_COLUMNS = [("time_block", "Time Block"), ("subject", "Subject"), ("task_title", "Task"), ("planned_hours", "Hours")]
+
+
 # =====================================================
 # INITIALIZE SESSION STATE
 # =====================================================
 
+# Session keys and the factory that builds each default. Factories are only called
+# for missing keys, so steady-state reruns allocate nothing here.
+SESSION_DEFAULTS = (
+    ("subjects", list),            # list of dicts
+    ("subject_names", list),       # names of subjects, same order
+    ("subject_name_keys", set),    # casefolded names, for duplicate checks
+    ("tasks_by_id", dict),         # id -> task dict, every task
+    ("tasks_pending", list),       # pending tasks, due-date order
+    ("tasks_completed", list),     # completed tasks, due-date order
+    ("exams", list),               # list of dicts, date order
+    ("next_id", lambda: 1),        # next id for any record (subject, task, exam)
+    ("schedule", list),            # generated study plan (list of dicts)
+    ("schedule_by_day", dict),     # date -> that day's sessions from schedule
+    ("subjects_version", int),     # bumped whenever subjects change
+    ("tasks_version", int),        # bumped whenever tasks change
+    ("exams_version", int),        # bumped whenever exams change
+    ("schedule_version", int),     # bumped whenever a plan is generated
+)
+
+
 def init_state():
-    if "subjects" not in st.session_state:
-        st.session_state.subjects = []   # list of dicts
-    if "tasks" not in st.session_state:
-        st.session_state.tasks = []      # list of dicts
-    if "exams" not in st.session_state:
-        st.session_state.exams = []      # list of dicts
-    if "next_id" not in st.session_state:
-        st.session_state.next_id = 1
-    if "schedule" not in st.session_state:
-        st.session_state.schedule = []   # generated study plan (list of dicts)
+    # Checked on every rerun so keys added after a session started are filled in
+    for key, factory in SESSION_DEFAULTS:
+        if key not in st.session_state:
+            st.session_state[key] = factory()
 
 
 def get_new_id():
     nid = st.session_state.next_id
-    st.session_state.next_id += 1
+    st.session_state.next_id = nid + 1
     return nid
 
 
-def get_subject_names():
-    return [s["name"] for s in st.session_state.subjects]
+def build_table(records, columns):
+    """Build a display table column by column from a list of dicts.
+
+    `columns` is a list of (field, label) pairs; only those fields are read,
+    already under their display labels, so no column slice or rename is needed.
+    st.table still converts the returned {label: values} dict to a DataFrame.
+    """
+    return {label: [r[field] for r in records] for field, label in columns}
+
+
+def session_cached(name, key, build):
+    """Return build() memoized in this session's state until `key` changes.
+
+    Kept per session on purpose: st.cache_data is shared by every session,
+    so a per-session version counter is not a safe key for it.
+    """
+    cache = st.session_state.get(name)
+    if cache is None or cache[0] != key:
+        cache = (key, build())
+        st.session_state[name] = cache
+    return cache[1]
+
+
+def exam_date_key(e):
+    return e["date"]
+
+
+def complete_ticked_tasks(editor_key, task_ids):
+    # Submit callback: runs before the rerun, so the tables already reflect it.
+    # edited_rows maps row position -> changed cells; task_ids is in the same row order.
+    edited_rows = st.session_state[editor_key]["edited_rows"]
+    done = {task_ids[row] for row, changes in edited_rows.items() if changes.get("Done")}
+    if not done:
+        return
+    for task_id in done:
+        t = st.session_state.tasks_by_id[task_id]
+        t["status"] = STATUS_COMPLETED
+        bisect.insort(st.session_state.tasks_completed, t, key=task_due_key)
+    st.session_state.tasks_pending = [t for t in st.session_state.tasks_pending if t["id"] not in done]
+    st.session_state.tasks_version += 1
+    st.toast(f"Marked {len(done)} task(s) as completed")
+
+
+def task_due_key(t):
+    # Tasks without a due date sort last; ids keep insertion order among equal dates
+    return (t["due_date"] or date.max, t["id"])
 
 
 # =====================================================
@@ -55,50 +156,41 @@ def sidebar():
 # DASHBOARD TAB
 # =====================================================
 
-def dashboard_tab(student_name):
+def dashboard_tab(student_name, today):
     st.header(f"📊 Dashboard – Hello, {student_name}!")
 
-    today = date.today()
     st.write(f"**Today:** {today.strftime('%A, %d %B %Y')}")
 
     # Today's schedule if generated
     st.subheader("🕒 Today's Study Plan")
-    today_plan = [s for s in st.session_state.schedule if s["date"] == today]
+    today_plan = st.session_state.schedule_by_day.get(today, [])
 
     if today_plan:
-        df_today = pd.DataFrame(today_plan)
-        df_today_display = df_today[["time_block", "subject", "task_title", "planned_hours"]]
-        df_today_display.columns = ["Time Block", "Subject", "Task", "Hours"]
-        st.table(df_today_display)
+        st.table(build_table(today_plan, TODAY_PLAN_COLUMNS))
     else:
         st.info("No generated study plan for today yet. Go to **Generate Study Plan** tab.")
 
     # Upcoming tasks
     st.subheader("📌 Upcoming Study Tasks (Next 7 Days)")
-    upcoming_tasks = []
-    for t in st.session_state.tasks:
-        if t["status"] == "Pending" and t["due_date"] is not None:
-            if today <= t["due_date"] <= today + timedelta(days=7):
-                upcoming_tasks.append(t)
+    # Pending tasks are in due-date order, so the next 7 days are one contiguous slice
+    pending = st.session_state.tasks_pending
+    lo = bisect.bisect_left(pending, (today,), key=task_due_key)
+    hi = bisect.bisect_left(pending, (today + timedelta(days=8),), key=task_due_key)
+    upcoming_tasks = pending[lo:hi]
 
     if upcoming_tasks:
-        df_up = pd.DataFrame(upcoming_tasks)
-        df_up_display = df_up[["title", "subject", "due_date", "estimated_hours", "importance"]]
-        df_up_display.columns = ["Task", "Subject", "Due Date", "Est. Hours", "Importance (1–5)"]
-        st.table(df_up_display)
+        st.table(build_table(upcoming_tasks, UPCOMING_TASK_COLUMNS))
     else:
         st.info("No pending tasks due in the next 7 days.")
 
     # Upcoming exams
     st.subheader("📝 Upcoming Exams")
-    upcoming_exams = [e for e in st.session_state.exams if e["date"] >= today]
-    upcoming_exams.sort(key=lambda x: x["date"])
+    # Exams are kept in date order, so the upcoming ones are a tail slice
+    exams = st.session_state.exams
+    upcoming_exams = exams[bisect.bisect_left(exams, today, key=exam_date_key):]
 
     if upcoming_exams:
-        df_ex = pd.DataFrame(upcoming_exams)
-        df_ex_display = df_ex[["subject", "title", "date", "syllabus"]]
-        df_ex_display.columns = ["Subject", "Exam", "Date", "Syllabus / Chapters"]
-        st.table(df_ex_display)
+        st.table(build_table(upcoming_exams, EXAM_COLUMNS))
     else:
         st.info("No future exams added yet.")
 
@@ -119,23 +211,31 @@ def subjects_tab():
         if submit:
             if not name.strip():
                 st.error("Subject name is required.")
+            elif name.strip().casefold() in st.session_state.subject_name_keys:
+                st.error(f"Subject already exists: {name.strip()}")
             else:
+                # interned: tasks and exams store the same name object
+                subject_name = sys.intern(name.strip())
                 st.session_state.subjects.append(
                     {
                         "id": get_new_id(),
-                        "name": name.strip(),
+                        "name": subject_name,
                         "teacher": teacher.strip(),
                         "code": code.strip(),
                     }
                 )
+                st.session_state.subject_names.append(subject_name)
+                st.session_state.subject_name_keys.add(subject_name.casefold())
+                st.session_state.subjects_version += 1
                 st.success(f"Added subject: {name.strip()}")
 
     if st.session_state.subjects:
         st.subheader("Your Subjects")
-        df = pd.DataFrame(st.session_state.subjects)
-        df_display = df[["name", "teacher", "code"]]
-        df_display.columns = ["Subject", "Teacher", "Code"]
-        st.table(df_display)
+        st.table(session_cached(
+            "_subjects_table_cache",
+            st.session_state.subjects_version,
+            lambda: build_table(st.session_state.subjects, SUBJECT_COLUMNS),
+        ))
     else:
         st.info("No subjects added yet. Use the form above to add one.")
 
@@ -144,20 +244,20 @@ def subjects_tab():
 # STUDY TASKS TAB
 # =====================================================
 
-def tasks_tab():
+def tasks_tab(today):
     st.header("📌 Study Tasks")
 
     if not st.session_state.subjects:
         st.warning("Add at least one subject first in the **Subjects** tab.")
         return
 
-    subjects = get_subject_names()
+    subjects = st.session_state.subject_names
 
     with st.form("add_task_form", clear_on_submit=True):
         title = st.text_input("Task title", placeholder="e.g. Revise Sorting Algorithms")
         subject = st.selectbox("Subject", subjects)
         estimated_hours = st.number_input("Estimated hours needed", min_value=0.5, max_value=50.0, value=2.0, step=0.5)
-        due_date = st.date_input("Due date (optional)", value=date.today())
+        due_date = st.date_input("Due date (optional)", value=today)
         has_due = st.checkbox("This task has a due date", value=True)
         if not has_due:
             due_date = None
@@ -171,45 +271,64 @@ def tasks_tab():
             if not title.strip():
                 st.error("Task title is required.")
             else:
-                st.session_state.tasks.append(
-                    {
-                        "id": get_new_id(),
-                        "title": title.strip(),
-                        "subject": subject,
-                        "estimated_hours": float(estimated_hours),
-                        "due_date": due_date,
-                        "importance": int(importance),
-                        "difficulty": int(difficulty),
-                        "status": "Pending",  # or Completed
-                    }
-                )
+                task = {
+                    "id": get_new_id(),
+                    "title": title.strip(),
+                    "subject": subject,
+                    "estimated_hours": float(estimated_hours),
+                    "due_date": due_date,
+                    "importance": int(importance),
+                    "difficulty": int(difficulty),
+                    # date-independent part of the scheduler's priority score
+                    "base_score": int(importance) * IMPORTANCE_WEIGHT + int(difficulty),
+                    "status": STATUS_PENDING,  # or STATUS_COMPLETED
+                }
+                # Keep pending tasks in due-date order so views never need to sort them
+                bisect.insort(st.session_state.tasks_pending, task, key=task_due_key)
+                st.session_state.tasks_by_id[task["id"]] = task
+                st.session_state.tasks_version += 1
                 st.success(f"Added task: {title.strip()}")
 
-    if st.session_state.tasks:
+    if st.session_state.tasks_by_id:
+        pending = st.session_state.tasks_pending
+        completed = st.session_state.tasks_completed
+
         st.subheader("Pending Tasks")
-        pending = [t for t in st.session_state.tasks if t["status"] == "Pending"]
 
         if pending:
-            df_p = pd.DataFrame(pending)
-            df_p_display = df_p[["title", "subject", "estimated_hours", "due_date", "importance", "difficulty"]]
-            df_p_display.columns = ["Task", "Subject", "Est. Hours", "Due Date", "Importance", "Difficulty"]
-            st.table(df_p_display)
-
-            st.subheader("Mark Tasks as Completed")
-            for t in pending:
-                if st.checkbox(f"Mark '{t['title']}' as completed", key=f"task_done_{t['id']}"):
-                    t["status"] = "Completed"
-                    st.success(f"Task marked as completed: {t['title']}")
+            # One editor widget for the whole list instead of a checkbox per task;
+            # the key follows tasks_version so ticks reset once tasks change.
+            editor_key = f"pending_editor_{st.session_state.tasks_version}"
+            editor_data = session_cached(
+                "_pending_editor_cache",
+                st.session_state.tasks_version,
+                lambda: {"Done": [False] * len(pending), **build_table(pending, TASK_COLUMNS)},
+            )
+            # Inside a form, ticks don't rerun the script; they are applied together on submit
+            with st.form("pending_tasks_form"):
+                st.caption("Tick **Done** for finished tasks, then apply.")
+                st.data_editor(
+                    editor_data,
+                    column_config={"Done": st.column_config.CheckboxColumn("Done")},
+                    disabled=[label for _, label in TASK_COLUMNS],
+                    hide_index=True,
+                    key=editor_key,
+                )
+                st.form_submit_button(
+                    "Mark ticked tasks as completed",
+                    on_click=complete_ticked_tasks,
+                    args=(editor_key, [t["id"] for t in pending]),
+                )
         else:
             st.info("No pending tasks.")
 
         st.subheader("Completed Tasks")
-        completed = [t for t in st.session_state.tasks if t["status"] == "Completed"]
         if completed:
-            df_c = pd.DataFrame(completed)
-            df_c_display = df_c[["title", "subject", "estimated_hours", "due_date", "importance", "difficulty"]]
-            df_c_display.columns = ["Task", "Subject", "Est. Hours", "Due Date", "Importance", "Difficulty"]
-            st.table(df_c_display)
+            st.table(session_cached(
+                "_completed_table_cache",
+                st.session_state.tasks_version,
+                lambda: build_table(completed, TASK_COLUMNS),
+            ))
         else:
             st.info("No completed tasks yet.")
     else:
@@ -220,19 +339,19 @@ def tasks_tab():
 # EXAMS TAB
 # =====================================================
 
-def exams_tab():
+def exams_tab(today):
     st.header("📝 Exams")
 
     if not st.session_state.subjects:
         st.warning("Add at least one subject first in the **Subjects** tab.")
         return
 
-    subjects = get_subject_names()
+    subjects = st.session_state.subject_names
 
     with st.form("add_exam_form", clear_on_submit=True):
         subject = st.selectbox("Subject", subjects)
         title = st.text_input("Exam title", placeholder="e.g. Mid Semester Exam")
-        exam_date = st.date_input("Exam date", value=date.today())
+        exam_date = st.date_input("Exam date", value=today)
         syllabus = st.text_area("Syllabus / Chapters to cover", height=80, placeholder="e.g. Units 1–3")
 
         submit = st.form_submit_button("Add Exam")
@@ -241,23 +360,27 @@ def exams_tab():
             if not title.strip():
                 st.error("Exam title is required.")
             else:
-                st.session_state.exams.append(
+                bisect.insort(
+                    st.session_state.exams,
                     {
                         "id": get_new_id(),
                         "subject": subject,
                         "title": title.strip(),
                         "date": exam_date,
                         "syllabus": syllabus.strip(),
-                    }
+                    },
+                    key=exam_date_key,
                 )
+                st.session_state.exams_version += 1
                 st.success(f"Added exam: {title.strip()}")
 
     if st.session_state.exams:
         st.subheader("All Exams")
-        df = pd.DataFrame(st.session_state.exams)
-        df_display = df[["subject", "title", "date", "syllabus"]]
-        df_display.columns = ["Subject", "Exam", "Date", "Syllabus / Chapters"]
-        st.table(df_display)
+        st.table(session_cached(
+            "_exams_table_cache",
+            st.session_state.exams_version,
+            lambda: build_table(st.session_state.exams, EXAM_COLUMNS),
+        ))
     else:
         st.info("No exams added yet.")
 
@@ -266,79 +389,121 @@ def exams_tab():
 # STUDY PLAN GENERATOR TAB
 # =====================================================
 
-def generate_study_plan(daily_hours, num_days):
+def plan_session(day, date_str, block_index, t, hours):
+    return {
+        "date": day,
+        "date_str": date_str,
+        "time_block": f"Session {block_index}",
+        "subject": t["subject"],
+        "task_title": t["title"],
+        "planned_hours": round(hours, 2),
+    }
+
+
+def save_schedule(plan, plan_by_day):
+    st.session_state.schedule = plan
+    st.session_state.schedule_by_day = plan_by_day
+    st.session_state.schedule_version += 1
+    return plan
+
+
+def generate_study_plan(daily_hours, num_days, today):
     """Simple greedy scheduler:
     - Take all pending tasks
     - Compute priority score based on importance, difficulty, due date
+      (equal scores go to the task added first, not tasks_pending's due order)
     - Allocate hours across upcoming days until tasks are filled or hours end
     """
-    today = date.today()
-    pending_tasks = [t for t in st.session_state.tasks if t["status"] == "Pending"]
-
-    if not pending_tasks:
-        st.session_state.schedule = []
-        return []
-
-    # Compute priority score
-    tasks_with_score = []
-    for t in pending_tasks:
-        days_left = 30  # default if no due date
-        if t["due_date"] is not None:
-            d = (t["due_date"] - today).days
-            if d < 0:
-                d = 0
-            days_left = d if d > 0 else 1
-
-        # higher importance & difficulty, closer due date => higher score
-        urgency = 1.0 / days_left
-        score = t["importance"] * 2 + t["difficulty"] + urgency * 5
-        tasks_with_score.append((t, score))
-
-    # Sort by score descending
-    tasks_with_score.sort(key=lambda x: x[1], reverse=True)
+    pending_tasks = st.session_state.tasks_pending
+
+    if not pending_tasks or num_days <= 0:
+        return save_schedule([], {})
+
+    # Compute all priority scores in one vectorized pass:
+    # higher importance & difficulty, closer due date => higher score
+    n = len(pending_tasks)
+    base = np.fromiter((t["base_score"] for t in pending_tasks), dtype=np.float64, count=n)
+    due_ord = np.fromiter(
+        (t["due_date"].toordinal() if t["due_date"] is not None else -1 for t in pending_tasks),
+        dtype=np.int64,
+        count=n,
+    )
+    days_left = np.where(due_ord < 0, NO_DUE_DATE_DAYS, np.maximum(due_ord - today.toordinal(), 1))
+    scores = (base + URGENCY_WEIGHT * (1.0 / days_left)).tolist()
+
+    # Hours still to schedule, tracked locally so the tasks' own estimates are never
+    # modified and regenerating the plan starts from the same inputs.
+    remaining = [t["estimated_hours"] for t in pending_tasks]
+
+    # Fast path: everything fits into the first day, so each task gets one session
+    # today in priority order (ties by id, like the queue) and no day loop is needed.
+    if sum(remaining) <= daily_hours:
+        date_str = today.strftime("%d %b %Y")
+        order = sorted(
+            (i for i in range(n) if remaining[i] > 0),
+            key=lambda i: (-scores[i], pending_tasks[i]["id"]),
+        )
+        plan = [
+            plan_session(today, date_str, block_index, pending_tasks[i], remaining[i])
+            for block_index, i in enumerate(order, 1)
+        ]
+        return save_schedule(plan, {today: plan} if plan else {})
+
+    # Queue tasks that still need hours.
+    # Keys are (-score, id, position): the best task pops first and ties go to the task
+    # added first, whatever order tasks_pending is kept in; position indexes `remaining`.
+    heap = [(-scores[i], t["id"], i, t) for i, t in enumerate(pending_tasks) if remaining[i] > 0]
+    heapq.heapify(heap)
 
     # Available hours per day
     plan = []
+    plan_by_day = {}
     current_date = today
     for day_index in range(num_days):
+        if not heap:
+            break
+
         day_hours_left = float(daily_hours)
         time_block_index = 1
+        date_str = current_date.strftime("%d %b %Y")   # formatted once per day, not per render
+        day_sessions = plan_by_day[current_date] = []
 
-        for i in range(len(tasks_with_score)):
-            t, score = tasks_with_score[i]
-            if t["estimated_hours"] <= 0:
-                continue
-
-            if day_hours_left <= 0:
-                break
+        while heap and day_hours_left > 0:
+            key = heapq.heappop(heap)
+            _, _, i, t = key
 
             # assign min(hours_left, estimated_hours_remaining)
-            assigned = min(day_hours_left, t["estimated_hours"])
-            if assigned <= 0:
-                continue
-
-            plan.append(
-                {
-                    "date": current_date,
-                    "time_block": f"Session {time_block_index}",
-                    "subject": t["subject"],
-                    "task_title": t["title"],
-                    "planned_hours": round(assigned, 2),
-                }
-            )
+            assigned = min(day_hours_left, remaining[i])
 
-            t["estimated_hours"] -= assigned
+            session = plan_session(current_date, date_str, time_block_index, t, assigned)
+            plan.append(session)
+            day_sessions.append(session)
+
+            remaining[i] -= assigned
             day_hours_left -= assigned
             time_block_index += 1
 
+            # a partly scheduled task keeps its key and stays at the front for the next day
+            if remaining[i] > 0:
+                heapq.heappush(heap, key)
+
         current_date += timedelta(days=1)
 
-    # save plan
-    st.session_state.schedule = plan
-    return plan
+    return save_schedule(plan, plan_by_day)
+
+
+def daily_hours_summary():
+    # Total planned hours per day, labelled for the bar chart
+    return pd.Series(
+        {
+            d.strftime("%d %b"): sum(s["planned_hours"] for s in sessions)
+            for d, sessions in st.session_state.schedule_by_day.items()
+        },
+        name="planned_hours",
+    )
 
 
-def plan_tab(daily_hours, num_days):
+def plan_tab(daily_hours, num_days, today):
     st.header("📅 Generate Study Plan")
 
     st.write(
@@ -346,12 +511,12 @@ def plan_tab(daily_hours, num_days):
         "based on your pending tasks, importance, difficulty, and due dates."
     )
 
-    if not st.session_state.tasks:
+    if not st.session_state.tasks_by_id:
         st.warning("Add some study tasks first in the **Study Tasks** tab.")
         return
 
     if st.button("Generate Study Plan"):
-        plan = generate_study_plan(daily_hours, num_days)
+        plan = generate_study_plan(daily_hours, num_days, today)
         if not plan:
             st.info("No plan generated (no pending tasks).")
         else:
@@ -360,19 +525,15 @@ def plan_tab(daily_hours, num_days):
     if st.session_state.schedule:
         st.subheader("Generated Plan")
 
-        df = pd.DataFrame(st.session_state.schedule)
-        df_display = df.copy()
-        df_display["date"] = df_display["date"].apply(lambda d: d.strftime("%d %b %Y"))
-        df_display = df_display[["date", "time_block", "subject", "task_title", "planned_hours"]]
-        df_display.columns = ["Date", "Session", "Subject", "Task", "Hours"]
-        st.table(df_display)
+        st.table(session_cached(
+            "_plan_table_cache",
+            st.session_state.schedule_version,
+            lambda: build_table(st.session_state.schedule, PLAN_COLUMNS),
+        ))
 
         # Summary: total hours per day
         st.subheader("Daily Study Hours Summary")
-        df_summary = df.groupby("date")["planned_hours"].sum().reset_index()
-        df_summary["date_str"] = df_summary["date"].apply(lambda d: d.strftime("%d %b"))
-        df_summary = df_summary.set_index("date_str")
-        st.bar_chart(df_summary["planned_hours"])
+        st.bar_chart(session_cached("_plan_summary_cache", st.session_state.schedule_version, daily_hours_summary))
 
 
 # =====================================================
@@ -412,23 +573,24 @@ def main():
     init_state()
 
     student_name, daily_hours, num_days = sidebar()
+    today = date.today()   # read the clock once per rerun
 
     tabs = st.tabs(["🏠 Dashboard", "📚 Subjects", "📌 Study Tasks", "📝 Exams", "📅 Generate Plan", "ℹ️ About"])
 
     with tabs[0]:
-        dashboard_tab(student_name)
+        dashboard_tab(student_name, today)
 
     with tabs[1]:
         subjects_tab()
 
     with tabs[2]:
-        tasks_tab()
+        tasks_tab(today)
 
     with tabs[3]:
-        exams_tab()
+        exams_tab(today)
 
     with tabs[4]:
-        plan_tab(daily_hours, num_days)
+        plan_tab(daily_hours, num_days, today)
 
     with tabs[5]:
         about_tab()